@@ -6,7 +6,7 @@ from .exceptions import InvalidPrefixException
 
 
 
-_masksForPrefixes = dict[int, list[int]]()
+_masksForPrefixes = dict[int, tuple[int, ...]]()
 
 
 
@@ -29,18 +29,26 @@ def _generateMasks(maxPrefix: int) -> list[int]:
 	
 	return masks
 
+_masksIPv4 = tuple(_generateMasks(32))
+_masksIPv6 = tuple(_generateMasks(128))
+
 def prefixToMask(maxPrefix: int, prefix: int) -> int:
-	if maxPrefix < 0:
-		raise InvalidPrefixException(prefix, maxPrefix)
+	if maxPrefix == 32:
+		masks = _masksIPv4
+	elif maxPrefix == 128:
+		masks = _masksIPv6
+	else:
+		if maxPrefix < 0:
+			raise InvalidPrefixException(prefix, maxPrefix)
+
+		masks = _masksForPrefixes.get(maxPrefix)
+
+		if masks == None:
+			masks = tuple(_generateMasks(maxPrefix))
+			_masksForPrefixes[maxPrefix] = masks
+
 	if prefix < 0:
 		raise InvalidPrefixException(prefix)
-	
-	masks = _masksForPrefixes.get(maxPrefix)
-
-	if masks == None:
-		masks = _generateMasks(maxPrefix)
-		_masksForPrefixes[maxPrefix] = masks
-	
 	if prefix >= len(masks):
 		raise InvalidPrefixException(prefix, maxPrefix)
 
@@ -49,6 +57,8 @@ def prefixToMask(maxPrefix: int, prefix: int) -> int:
 
 
 class Address(SupportsInt, SupportsBytes):
+	__slots__ = ("_addressInt",)
+
 	def __init__(self, addressInt: int):
 		self._addressInt = addressInt
 
@@ -62,7 +72,7 @@ class Address(SupportsInt, SupportsBytes):
 		return self.toString()
 
 	def __eq__(self, other: object) -> bool:
-		if type(other) == type(self):
+		if type(other) is type(self):
 			return self.addressInt == other.addressInt
 		else:
 			return False
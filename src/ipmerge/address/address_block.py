@@ -1,3 +1,7 @@
+from operator import attrgetter
+from socket import AF_INET, inet_pton
+from typing import Callable
+
 from .address import Address, prefixToMask
 from .ipv4 import IPv4_Address
 from .ipv6 import IPv6_Address, DualOutputMode
@@ -6,18 +10,36 @@ from .exceptions import InvalidNetworkAddressException, InvalidPrefixException,
 
 
 class Address_Block:
-	addressTypes: set[type[Address]] = {IPv4_Address, IPv6_Address}
+	__slots__ = ("_address", "_prefix", "_mask", "_first", "_last")
+
+	addressTypes: tuple[type[Address], ...] = (IPv4_Address, IPv6_Address)
+
+	# sort key, fetching the cached value in C instead of calling a Python function per block
+	addressKey = attrgetter("_first")
 
 	def __init__(self, address: Address, prefix : int):
 		self._address = address
 		self._prefix = prefix
 		self._mask = prefixToMask(address.addressLength, prefix)
+		self._first = address.addressInt
+		self._last = self._first | ((1 << (address.addressLength - prefix)) - 1)
 
-		if (self._address.addressInt & (~self._mask)) != 0:		# network address isn't valid network address for the given prefix
-			raise InvalidNetworkAddressException(self._address.__str__(), self._prefix)
+		if (self._first & (~self._mask)) != 0:		# network address isn't valid network address for the given prefix
+			raise InvalidNetworkAddressException(str(self._address), self._prefix)
+	
+	@staticmethod
+	def _fromValidated(address: Address, prefix: int, mask: int, first: int, last: int) -> "Address_Block":
+		# constructor for values already known to be consistent (i.e. produced by merging), skips mask lookup and validation
+		block = Address_Block.__new__(Address_Block)
+		block._address = address
+		block._prefix = prefix
+		block._mask = mask
+		block._first = first
+		block._last = last
+		return block
 	
 	def __eq__(self, value: object) -> bool:
-		if type(value) == Address_Block:
+		if type(value) is Address_Block:
 			return self.address == value.address and self.prefix == value.prefix
 		else:
 			return False
@@ -32,33 +54,58 @@ class Address_Block:
 	
 	@property
 	def firstAddress(self) -> int:
-		return self.address.addressInt
+		return self._first
 
 	@property
 	def lastAddress(self) -> int:
-		return self.address.addressInt | ((1 << (self.address.addressLength - self.prefix)) - 1)
+		return self._last
 
 	def __str__(self) -> str:
 		return self.toString()
 
+	@staticmethod
+	def sort(blocks: list["Address_Block"]) -> None:
+		# orders by network address and then by prefix, so a block always comes before the blocks it contains
+		if len({block._prefix for block in blocks}) <= 1:	# all blocks of same size, address alone gives the order
+			blocks.sort(key=Address_Block.addressKey)
+		else:	# one integer key per block, compares much faster than an (address, prefix) tuple
+			blocks.sort(key=lambda block: (block._first << 8) | block._prefix)
+
 	@staticmethod
 	def parse(string: str) -> "Address_Block":
-		blockParts = string.split("/")
+		addressString, separator, prefixString = string.partition("/")
+		return Address_Block.fromParts(addressString, prefixString if separator else None)
+
+	@staticmethod
+	def fromParts(addressString: str, prefixString: str | None) -> "Address_Block":
+		if ":" not in addressString:	# common case of a canonical IPv4 block (or host), parsed without going through the generic address parsing
+			try:
+				addressInt = int.from_bytes(inet_pton(AF_INET, addressString), byteorder="big", signed=False)
+				prefix = 32 if prefixString is None else int(prefixString)
+			except (OSError, ValueError):
+				pass
+			else:
+				if 0 <= prefix <= 32:	# out of range prefixes are reported by the generic path below
+					return Address_Block(IPv4_Address(addressInt), prefix)
+
+		if prefixString is not None and "/" in prefixString:	# more than one prefix separator
+			raise UnrecognizedAddressException(addressString + "/" + prefixString)
+
 		address = None
 
 		for addressType in Address_Block.addressTypes:
-			address = addressType.parse(blockParts[0])
-			if address != None:
+			address = addressType.parse(addressString)
+			if address is not None:
 				break
 
-		if address == None:
-			raise UnrecognizedAddressException(string)
+		if address is None:
+			raise UnrecognizedAddressException(addressString if prefixString is None else addressString + "/" + prefixString)
 		
 		prefix = None
-		if len(blockParts) < 2:
+		if prefixString is None:
 			prefix = address.addressLength
 		else:
-			prefix = int(blockParts[1])
+			prefix = int(prefixString)
 			if prefix < 0 or prefix > address.addressLength:
 				raise InvalidPrefixException(prefix, address.addressLength, address.addressTypeText)
 
@@ -66,7 +113,7 @@ class Address_Block:
 	
 	def toString(self, compressed: bool = True, uppercase: bool = True, dualOutputMode: DualOutputMode = DualOutputMode.VALUE_DEPENDENT, alwaysOutputPrefix: bool = False) -> str:
 		addressString: str
-		if type(self.address) == IPv6_Address:
+		if type(self.address) is IPv6_Address:
 			addressString = self.address.toString(compressed, uppercase, dualOutputMode)
 		else:
 			addressString = self.address.toString()
@@ -78,34 +125,71 @@ class Address_Block:
 	
 	@staticmethod
 	def merge(block1: "Address_Block", block2: "Address_Block") -> "Address_Block | None":
-		if type(block1.address) != type(block2.address):
+		addressType = type(block1.address)
+		if addressType is not type(block2.address):
 			return None
 		elif block1._mask == block2._mask:
-			if block1.address == block2.address:
-				if type(block1.address) == IPv6_Address:
+			if block1._first == block2._first:
+				if addressType is IPv6_Address:
 					block1.address.setDualAfterMerge(block1.address, block2.address)
-				return Address_Block(block1.address, block1.prefix)
+				return block1
 			
-			lower = None
-
-			if block1.lastAddress == block2.firstAddress - 1:
-				lower = block1
-			elif block2.lastAddress == block1.firstAddress - 1:
-				lower = block2
+			if block1._last == block2._first - 1:
+				lower, upper = block1, block2
+			elif block2._last == block1._first - 1:
+				lower, upper = block2, block1
+			else:
+				return None
 
-			if lower != None and (lower.address.addressInt & ~(lower._mask << 1) == 0):
-				if type(lower.address) == IPv6_Address:
+			if lower._first & ~(lower._mask << 1) == 0:
+				if addressType is IPv6_Address:
 					lower.address.setDualAfterMerge(block1.address, block2.address)
-				return Address_Block(lower.address, lower.prefix - 1)
+				# mask of the parent block is the lower block's mask without its lowest set bit
+				return Address_Block._fromValidated(lower.address, lower.prefix - 1, lower._mask & (lower._mask - 1), lower._first, upper._last)
 			else:
 				return None
-		elif block2.firstAddress <= block1.firstAddress and block1.lastAddress <= block2.lastAddress:
-			if type(block2.address) == IPv6_Address:
+		elif block2._first <= block1._first and block1._last <= block2._last:
+			if addressType is IPv6_Address:
 				block2.address.setDualAfterMerge(block1.address, block2.address)
-			return Address_Block(block2.address, block2.prefix)
-		elif block1.firstAddress <= block2.firstAddress and block2.lastAddress <= block1.lastAddress:
-			if type(block1.address) == IPv6_Address:
+			return block2
+		elif block1._first <= block2._first and block2._last <= block1._last:
+			if addressType is IPv6_Address:
 				block1.address.setDualAfterMerge(block1.address, block2.address)
-			return Address_Block(block1.address, block1.prefix)
+			return block1
 		
 		return None
+
+	@staticmethod
+	def mergeSorted(blocks: list["Address_Block"], onMerge: Callable[["Address_Block", "Address_Block", "Address_Block"], None] | None = None) -> list["Address_Block"]:
+		# merges blocks ordered by Address_Block.sort into the smallest covering list, onMerge is called with both inputs and the result of every merge
+		mergeBlocks = Address_Block.merge
+		merged = list[Address_Block]()
+		push = merged.append
+		pop = merged.pop
+		previous: Address_Block | None = None	# top of the stack, kept out of the list while it can still be merged
+
+		for block in blocks:
+			while previous is not None:
+				if block._first > previous._last + 1:	# a block starting past the end of the top (and not adjacent to it) can't merge with it
+					break
+				mergedBlock = mergeBlocks(previous, block)
+				if mergedBlock is None:
+					break
+
+				if onMerge is not None:
+					onMerge(previous, block, mergedBlock)
+
+				block = mergedBlock
+				if block is previous:	# absorbed into the top, whose left neighbour is already known not to merge with it
+					break
+				previous = pop() if len(merged) > 0 else None
+
+			if previous is not block:
+				if previous is not None:
+					push(previous)
+				previous = block
+
+		if previous is not None:
+			push(previous)
+
+		return merged
@@ -1,33 +1,48 @@
+from socket import AF_INET, inet_ntop, inet_pton
+
 from .address import Address
 
 
 
+def _parseIPv4(string: str) -> int | None:
+	try:	# strict dotted-quad parsing done in C, the loop below handles everything else
+		return int.from_bytes(inet_pton(AF_INET, string), byteorder="big", signed=False)
+	except (OSError, ValueError):
+		pass
+
+	octets = string.split(".")
+	
+	if len(octets) != 4:
+		return None
+	
+	address = 0
+	for i in range(len(octets)):
+		try:
+			octet = int(octets[i])
+		except ValueError:
+			return None
+		if octet < 0 or octet > 255:
+			return None
+		
+		address |= octet << ((4 - i - 1) * 8)
+	
+	return address
+
+
+
 class IPv4_Address(Address):
+	__slots__ = ()
+
 	def __init__(self, address: int):
 		super().__init__(address)
 	
 	@staticmethod
 	def parse(string: str) -> "IPv4_Address | None":
-		octets = string.split(".")
-		
-		if len(octets) != 4:
-			return None
-		
-		address = 0
-		for i in range(len(octets)):
-			try:
-				octet = int(octets[i])
-			except ValueError:
-				return None
-			if octet < 0 or octet > 255:
-				return None
-			
-			address |= octet << ((4 - i - 1) * 8)
-		
-		return IPv4_Address(address)
+		address = _parseIPv4(string)
+		return IPv4_Address(address) if address != None else None
 	
 	def toString(self) -> str:
-		return ".".join([str(byte) for byte in self.__bytes__()])
+		return inet_ntop(AF_INET, self.addressInt.to_bytes(length=4, byteorder="big", signed=False))
 
 	@property
 	def addressLength(self) -> int:
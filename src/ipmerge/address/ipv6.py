@@ -1,4 +1,5 @@
-from typing import Iterable, SupportsBytes, SupportsIndex, SupportsInt, overload
+from functools import lru_cache
+from typing import Sequence
 from enum import Enum
 
 from .address import Address
@@ -21,107 +22,146 @@ class DualOutputMode(Enum):
 
 
 
-class IPv6Segments(list[int], SupportsInt, SupportsBytes):
-	@overload
-	def __init__(self) -> None: ...
-	@overload
-	def __init__(self, initial: bytes) -> None: ...
-	@overload
-	def __init__(self, initial: Iterable[int]) -> None: ...
-	@overload
-	def __init__(self, initial: int) -> None: ...
+def _scanLongestZeroSegmentString(segments: Sequence[int]) -> tuple[int | None, int]:
+	maxZeros: int = 0
+	maxZerosIndex: int | None = None
+	currentZeros: int = 0
+	currentZerosIndex: int | None = None
 
-	def __init__(self, initial: Iterable[int] | bytes | int | None = None) -> None:
-		if initial == None:
-			return super().__init__()
-		
-		if type(initial) == int:
-			initial = initial.to_bytes(length=16, byteorder="big", signed=False)
-		
-		if type(initial) == bytes:
-			if len(initial) > 16:
-				raise ValueError()
-			
-			initial = initial.rjust(16, b"\0")
-			initialList = list[int]()
-			
-			for i in range(0, len(initial), 2):
-				initialList.append(initial[i] << 8 | initial[i + 1])
-			
-			return super().__init__(initialList)
+	for i in range(len(segments) + 1):		# +1 so if there is a zero-string at the end, it can still have effect on max values (as it will be forced into the elif branch)
+		if i < len(segments) and segments[i] == 0:	# i < end enables use of +1 above while preventing reading of a value after end
+			currentZeros += 1
+			if currentZerosIndex == None:
+				currentZerosIndex = i
+		elif currentZeros > 0:
+			if currentZeros > maxZeros:
+				maxZeros = currentZeros
+				maxZerosIndex = currentZerosIndex
+			currentZeros = 0
+			currentZerosIndex = None
 
-		# At this point, only option remaining for initial is Iterable[int]
-		initialIterable: Iterable[int] = initial # type: ignore
+	return (maxZerosIndex, maxZeros)
 
-		for x in initialIterable:
-			if x < 0 or x > 0xffff:
-				raise self.__createValueError(x)
-		return super().__init__(initialIterable)
+# Result of the scan above for every combination of 8 segments, indexed by a bitmap where bit i is set if segment i is zero
+_longestZeroSegmentStrings = tuple(_scanLongestZeroSegmentString([0 if zeroMap & (1 << i) else 1 for i in range(8)]) for zeroMap in range(256))
 
-	def __int__(self) -> int:
-		result = 0
-		for x in self:
-			result = (result << 16) | x
-		return result
-	
-	def __bytes__(self) -> bytes:
-		byteList = list[int]()
-		for x in self:
-			byteList.append(x >> 8 & 0xff)
-			byteList.append(x & 0xff)
-		return bytes(byteList)
-	
-	@staticmethod
-	def fromInt(value: int) -> "IPv6Segments":
-		return IPv6Segments(value.to_bytes(length=16, byteorder="big", signed=False))
+# Format strings for joining n hex segments with ':', indexed by n, so a whole group of segments is formatted by one % operation
+_compressedSegmentFormats = tuple(":".join(["%x"] * count) for count in range(9))
+_fullSegmentFormats = tuple(":".join(["%04x"] * count) for count in range(9))
+
+
+
+@lru_cache(maxsize=1 << 12)		# returns plain values, as IPv6_Address instances are mutable (dual flag)
+def _parseIPv6(string: str) -> tuple[int, bool] | None:
+	if ":" not in string:
+		return None
+
+	string = string.strip().replace(" ", "")
 	
-	@staticmethod
-	def __createValueError(value: int):
-		return ValueError(f"Value {value} ({hex(value)}) is outside of allowed range for IPv6 segment values (0 - 0xffff)")
+	if string == "::":
+		return (0, False)
 	
-	def append(self, item: int):
-		if item < 0 or item > 0xffff:
-			raise self.__createValueError(item)
-		else:
-			return super().append(item)
+	segments = string.split(":")
+
+	if len(segments) > 8:	# too many segments
+		return None
 	
-	def insert(self, index: SupportsIndex, item: int):
-		if item < 0 or item > 0xffff:
-			raise self.__createValueError(item)
+	left = 0	# segments before the 0-filling, accumulated into an integer
+	leftCount = 0
+	right = 0	# segments after the 0-filling
+	rightCount = 0
+	fillAt: None | int = None	# byte at which the 0-filling should start
+	dual = False
+
+	if string.startswith("::"):
+		fillAt = 0
+		segments = segments[2:]
+	elif string.endswith("::"):
+		segments = segments[:-2]
+		fillAt = len(segments)
+
+	for i, segment in enumerate(segments):
+		if dual:	# Another segment after the IPv4 part of a dual address is invalid
+			return None
+		
+		segment = segment.strip()
+		if len(segment) == 0:
+			if fillAt == None:
+				fillAt = i
+				continue
+			else:
+				return None
+		
+		if "." in segment:
+			if i != len(segments) - 1 or fillAt == len(segments):	# if not on last segment
+				return None
+			if len(segments) > 7:	# segment count check for a dual address
+				return None
+			dual = True
+			ipv4 = IPv4_Address.parse(segment)
+			if ipv4 == None:
+				return None
+			
+			if fillAt == None or fillAt == len(segments):
+				left = (left << 32) | ipv4.addressInt
+				leftCount += 2
+			else:
+				right = (right << 32) | ipv4.addressInt
+				rightCount += 2
+			continue
+		
+		try:
+			segmentInt = int(segment, base=16)
+		except ValueError:
+			return None
+		
+		if segmentInt < 0 or segmentInt > 0xffff:
+			return None
+		
+		if fillAt == None or fillAt == len(segments):
+			left = (left << 16) | segmentInt
+			leftCount += 1
 		else:
-			return super().insert(index, item)
-	
-	def extend(self, iterable: Iterable[int]):
-		for x in iterable:
-			if x < 0 or x > 0xffff:
-				raise self.__createValueError(x)
-		return super().extend(iterable)
+			right = (right << 16) | segmentInt
+			rightCount += 1
+
+	if leftCount + rightCount > 8:
+		return None
+	if fillAt == None and leftCount != 8:
+		return None
 	
+	return ((left << (16 * (8 - leftCount))) | right, dual)
 
 
 
 class IPv6_Address(Address):
-	def __init__(self, address: int | IPv6Segments, dual: bool = False):
-		if type(address) == int:
-			super().__init__(address)
-			self._segments = IPv6Segments(address)
-		elif type(address) == IPv6Segments:
-			super().__init__(int(address))
-			self._segments = address
+	__slots__ = ("_segments", "_ipv4", "_dual")
 
+	def __init__(self, address: int, dual: bool = False):
+		super().__init__(address)
+		self._segments: tuple[int, ...] | None = None
+		self._ipv4: IPv4_Address | None = None
 		self._dual = dual
 	
 	@property
 	def dual(self) -> bool:
 		return self._dual
 	
+	@property
+	def segments(self) -> tuple[int, ...]:
+		if self._segments is None:
+			self._segments = tuple((self.addressInt >> (16 * (7 - i))) & 0xffff for i in range(8))
+		return self._segments
+	
 	@property
 	def ipv4_part(self):
 		return self.addressInt & 0xffffffff
 	
 	@property
-	def ipv4(self):
-		return IPv4_Address(self.ipv4_part)
+	def ipv4(self) -> IPv4_Address:
+		if self._ipv4 is None:
+			self._ipv4 = IPv4_Address(self.ipv4_part)
+		return self._ipv4
 	
 	@property
 	def string(self):	# for debugging
@@ -129,109 +169,32 @@ class IPv6_Address(Address):
 	
 	@staticmethod
 	def parse(string: str) -> "IPv6_Address | None":
-		if ":" not in string:
-			return None
+		parsed = _parseIPv6(string)
+		return IPv6_Address(parsed[0], parsed[1]) if parsed != None else None
 
-		string = string.strip().replace(" ", "")
-		
-		if string == "::":
-			return IPv6_Address(0, False)
-		
-		segments = string.split(":")
-
-		if len(segments) > 8:	# too many segments
-			return None
-		
-		segmentList = IPv6Segments()
-		fillAt: None | int = None	# byte at which the 0-filling should start
-		dual = False
-
-		if string.startswith("::"):
-			fillAt = 0
-			segments = segments[2:]
-		elif string.endswith("::"):
-			segments = segments[:-2]
-			fillAt = len(segments)
+	@staticmethod
+	def findLongestZeroSegmentString(segments: Sequence[int]) -> tuple[int | None, int]:
+		if len(segments) > 8:
+			return _scanLongestZeroSegmentString(segments)
 
+		zeroMap = 0
 		for i, segment in enumerate(segments):
-			if dual:	# Another segment after the IPv4 part of a dual address is invalid
-				return None
-			
-			segment = segment.strip()
-			if len(segment) == 0:
-				if fillAt == None:
-					fillAt = i
-					continue
-				else:
-					return None
-			
-			if "." in segment:
-				if i != len(segments) - 1 or fillAt == len(segments):	# if not on last segment
-					return None
-				if len(segments) > 7:	# segment count check for a dual address
-					return None
-				dual = True
-				ipv4 = IPv4_Address.parse(segment)
-				if ipv4 != None:
-					segmentList.append((ipv4.addressInt >> 16) & 0xffff)
-					segmentList.append(ipv4.addressInt & 0xffff)
-					continue
-				else:
-					return None
-			
-			try:
-				segmentInt = int(segment, base=16)
-			except ValueError:
-				return None
-			
-			if segmentInt < 0 or segmentInt > 0xffff:
-				return None
-			
-			segmentList.append(segmentInt)
-
-		if type(fillAt) == int:
-			for _ in range(8 - len(segmentList)):
-				segmentList.insert(fillAt, 0)
-		elif fillAt == None and len(segmentList) != 8:
-			return None
-		
-		return IPv6_Address(segmentList, dual)
+			if segment == 0:
+				zeroMap |= 1 << i
 
-	@staticmethod
-	def findLongestZeroSegmentString(segments: list[int]) -> tuple[int | None, int]:
-		maxZeros: int = 0
-		maxZerosIndex: int | None = None
-		currentZeros: int = 0
-		currentZerosIndex: int | None = None
-
-		for i in range(len(segments) + 1):		# +1 so if there is a zero-string at the end, it can still have effect on max values (as it will be forced into the elif branch)
-			if i < len(segments) and segments[i] == 0:	# i < end enables use of +1 above while preventing reading of a value after end
-				currentZeros += 1
-				if currentZerosIndex == None:
-					currentZerosIndex = i
-			elif currentZeros > 0:
-				if currentZeros > maxZeros:
-					maxZeros = currentZeros
-					maxZerosIndex = currentZerosIndex
-				currentZeros = 0
-				currentZerosIndex = None
-
-		return (maxZerosIndex, maxZeros)
+		return _longestZeroSegmentStrings[zeroMap]
 	
-	@staticmethod
-	def _toHex(numbers: Iterable[int]) -> Iterable[str]:
-		return [hex(x).removeprefix("0x") for x in numbers]
-			
 	def _getCompressed(self, dual: bool) -> str:
 		end = 8 if not dual else 6
-		segments = self._segments[:end]
+		segments = self.segments[:end]
 
 		zeroPadIndex, zeroPadLength = IPv6_Address.findLongestZeroSegmentString(segments)
 		if zeroPadIndex == None or zeroPadLength < 2:
-			return ":".join(IPv6_Address._toHex(segments))
+			return _compressedSegmentFormats[len(segments)] % segments
 		
-		left = ":".join(IPv6_Address._toHex(segments[:zeroPadIndex]))
-		right = ":".join(IPv6_Address._toHex(segments[zeroPadIndex+zeroPadLength:]))
+		left = _compressedSegmentFormats[zeroPadIndex] % segments[:zeroPadIndex]
+		rightSegments = segments[zeroPadIndex+zeroPadLength:]
+		right = _compressedSegmentFormats[len(rightSegments)] % rightSegments
 
 		if len(left) > 0 and len(right) > 0:
 			return left + "::" + right
@@ -244,12 +207,14 @@ class IPv6_Address(Address):
 	
 	def _getFull(self, dual: bool) -> str:
 		end = 8 if not dual else 6
-		return ":".join([hex(x).removeprefix("0x").rjust(4, "0") for x in self._segments[: end + 1]])
+		segments = self.segments[: end + 1]
+		return _fullSegmentFormats[len(segments)] % segments
 
 	def toString(self, compressed: bool = True, uppercase: bool = True, dualOutputMode: DualOutputMode = DualOutputMode.VALUE_DEPENDENT) -> str:
 		outDual = self.dual and dualOutputMode == DualOutputMode.VALUE_DEPENDENT or dualOutputMode == DualOutputMode.FORCE_DUAL
 		result = self._getCompressed(outDual) if compressed else self._getFull(outDual)
-		result = result.upper() if uppercase else result.lower()
+		if uppercase:	# segments are always formatted in lowercase
+			result = result.upper()
 
 		if outDual:
 			if not result.endswith(":"):
@@ -259,7 +224,7 @@ class IPv6_Address(Address):
 		return result
 		
 	def setDualAfterMerge(self, address1: Address, address2: Address) -> None:
-		if type(address1) == IPv6_Address and type(address2) == IPv6_Address:
+		if type(address1) is IPv6_Address and type(address2) is IPv6_Address:
 			self._dual = address1.dual and address2.dual
 	
 	@property
@@ -4,7 +4,13 @@ from os import mkdir
 from typing import TextIO
 
 from .address.address_block import Address_Block
-from .parameters import IPMergeProgramParameters, IPMergeProgramParametersBuilder, DualOutputMode
+from .address.ipv4 import IPv4_Address
+from .address.ipv6 import IPv6_Address
+from .parameters import IPMergeProgramParameters, DualOutputMode
+
+
+
+_outputChunkSize = 4096		# blocks per write in printOutput
 
 
 
@@ -49,7 +55,7 @@ def _printHelp():
 
 
 def _parseParameters(arguments: list[str]) -> IPMergeProgramParameters:
-	parameters = IPMergeProgramParametersBuilder()
+	parameters = IPMergeProgramParameters()
 
 	if len(arguments) < 2:
 		_printUsage()
@@ -111,69 +117,63 @@ def _parseParameters(arguments: list[str]) -> IPMergeProgramParameters:
 		stderr.write("Output option found, but output file doesn't follow.\n")
 		exit(1)
 
-	return parameters.create()
+	return parameters
 
 
 
 
 
 def readInput(fileNames : list[str]) -> dict[type, list[Address_Block]]:
-	blocks = dict[type, list[Address_Block]]()
+	ipv4Blocks = list[Address_Block]()
+	ipv6Blocks = list[Address_Block]()
+	ipv6First = False	# families are output in the order they first appear in the input
 
 	for fileName in fileNames:
 		inputFile: TextIO = stdin if fileName == "-" else open(fileName, "rt")
+		data = inputFile.read()
+
+		if inputFile != stdin:
+			inputFile.close()
 		
-		for line in inputFile:
-			line = line.split("#")[0].strip()
+		for line in data.split("\n"):	# files opened in text mode translate line endings to '\n', but stdin may keep a trailing '\r', which strip() below removes
+			line = line.partition("#")[0].strip()
 			if len(line) == 0:
 				continue
 
 			block = Address_Block.parse(line)
 
-			blocksOfType = blocks.get(type(block.address))
-			if blocksOfType == None:
-				blocksOfType = list[Address_Block]()
-				blocks[type(block.address)] = blocksOfType
-
-			blocksOfType.append(block)
-
-		if inputFile != stdin:
-			inputFile.close()
+			if type(block.address) is IPv4_Address:
+				ipv4Blocks.append(block)
+			else:
+				if len(ipv6Blocks) == 0:
+					ipv6First = len(ipv4Blocks) == 0
+				ipv6Blocks.append(block)
 	
-	return blocks
+	families = ((IPv6_Address, ipv6Blocks), (IPv4_Address, ipv4Blocks)) if ipv6First else ((IPv4_Address, ipv4Blocks), (IPv6_Address, ipv6Blocks))
+	return {addressType: blocksOfType for addressType, blocksOfType in families if len(blocksOfType) > 0}
+
+def _reportMerge(block1: Address_Block, block2: Address_Block, mergedBlock: Address_Block) -> None:
+	stderr.write(f"Merged {block1} and {block2} into {mergedBlock}.\n")
 
 def merge(blockLists: dict[type, list[Address_Block]]) -> None:
-	verbosityLevel = IPMergeProgramParameters.getInstance().verbosityLevel
+	onMerge = _reportMerge if IPMergeProgramParameters.getInstance().verbosityLevel >= 2 else None
 
 	for blocks in blockLists.values():
-		blocks.sort(key=lambda block: block.address.addressInt)
-
-		index = 1
-
-		while index < len(blocks):
-			merged = Address_Block.merge(blocks[index - 1], blocks[index])
-
-			if merged == None:
-				index += 1
-			else:
-				if verbosityLevel >= 2:
-					stderr.write(f"Merged {blocks[index - 1]} and {blocks[index]} into {merged}.\n")
-
-				index -= 1
-				blocks.pop(index)
-				blocks.pop(index)
-				blocks.insert(index, merged)
-
-				if index == 0:
-					index = 1
+		Address_Block.sort(blocks)
+		blocks[:] = Address_Block.mergeSorted(blocks, onMerge)
 
 def printOutput(output: TextIO, blockLists: dict[type, list[Address_Block]]) -> None:
 	parameters = IPMergeProgramParameters.getInstance()
+	toString = Address_Block.toString
+	compressed = parameters.compressed
+	uppercase = parameters.uppercase
+	dualOutputMode = parameters.dualOutputMode
+	alwaysOutputPrefix = parameters.alwaysOutputPrefix
 
 	for i, blocks in enumerate(blockLists.values()):
-		for block in blocks:
-			output.write(block.toString(parameters.compressed, parameters.uppercase, parameters.dualOutputMode, parameters.alwaysOutputPrefix))
-			output.write("\n")
+		for start in range(0, len(blocks), _outputChunkSize):	# join lines into larger strings, but don't build the whole output in memory at once
+			chunk = "\n".join([toString(block, compressed, False, dualOutputMode, alwaysOutputPrefix) for block in blocks[start : start + _outputChunkSize]]) + "\n"
+			output.write(chunk.upper() if uppercase else chunk)	# case applied to the whole chunk, digits, dots and separators are unaffected
 		
 		if i < len(blockLists) - 1:
 			output.write("\n\n\n")
@@ -183,8 +183,8 @@ def printOutput(output: TextIO, blockLists: dict[type, list[Address_Block]]) ->
 
 
 def main_inner():
-	IPMergeProgramParameters.setInstance(_parseParameters(argv))
-	parameters = IPMergeProgramParameters.getInstance()
+	parameters = _parseParameters(argv)
+	IPMergeProgramParameters.setInstance(parameters)
 
 	blocks = readInput(parameters.inputFiles)
 	
@@ -212,15 +212,18 @@ def main_inner():
 		if parameters.verbosityLevel >= 2:
 			stderr.write("\n")
 		
+		decrease = originalBlockCount - currentSize
+		divisor = originalBlockCount if originalBlockCount > 0 else 1	# empty input, report 0 % instead of dividing by zero
+		
 		stderr.write(f"Original block count: {originalBlockCount}.\n")
-		stderr.write(f"Merged block count: {currentSize} ({round(currentSize / float(originalBlockCount) * 100, 2)} %).\n")
-		stderr.write(f"Decrease by: {originalBlockCount - currentSize} ({round((originalBlockCount - currentSize) / float(originalBlockCount) * 100, 2)} %).\n")
+		stderr.write(f"Merged block count: {currentSize} ({currentSize / divisor * 100:.2f} %).\n")
+		stderr.write(f"Decrease by: {decrease} ({decrease / divisor * 100:.2f} %).\n")
 
 def main():
 	try:
 		main_inner()
 	except Exception as e:
-		stderr.write(e.__str__())
+		stderr.write(str(e))
 		stderr.write("\n")
 		exit(1)
 
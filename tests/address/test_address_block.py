@@ -9,6 +9,8 @@ class Test_AddressBlock:
 	def test_parse_ok(self):
 		assert Address_Block.parse("0.0.0.0/24") == Address_Block(IPv4_Address(0), 24)
 		assert Address_Block.parse("0.0.0.2/31") == Address_Block(IPv4_Address(2), 31)
+		assert Address_Block.parse("192.168.0.1") == Address_Block(IPv4_Address(0xC0A80001), 32)
+		assert Address_Block.parse(" 10.0.0.0 /  8 ") == Address_Block(IPv4_Address(0x0A000000), 8)
 
 		assert Address_Block.parse("::/128") == Address_Block(IPv6_Address(0), 128)
 		assert Address_Block.parse("::") == Address_Block(IPv6_Address(0), 128)
@@ -17,6 +19,15 @@ class Test_AddressBlock:
 		assert Address_Block.parse("::  /   0\r\n") == Address_Block(IPv6_Address(0), 0)
 
 
+	def test_from_parts(self):
+		assert Address_Block.fromParts("10.0.0.0", "8") == Address_Block.parse("10.0.0.0/8")
+		assert Address_Block.fromParts("10.0.0.1", None) == Address_Block.parse("10.0.0.1")
+		assert Address_Block.fromParts("::", "0") == Address_Block(IPv6_Address(0), 0)
+
+		with pytest.raises(UnrecognizedAddressException):
+			Address_Block.fromParts("aa", "0")
+
+
 	def test_parse_fail(self):
 		with pytest.raises(UnrecognizedAddressException):
 			Address_Block.parse("/5")
@@ -24,10 +35,18 @@ class Test_AddressBlock:
 			Address_Block.parse("")
 		with pytest.raises(UnrecognizedAddressException):
 			Address_Block.parse("aa/0")
+		with pytest.raises(UnrecognizedAddressException):
+			Address_Block.parse("256.0.0.0/8")
+		with pytest.raises(UnrecognizedAddressException):
+			Address_Block.parse("1.2.3.4/5/6")
+		with pytest.raises(UnrecognizedAddressException):
+			Address_Block.parse("::/64/6")
 		
 		with pytest.raises(InvalidNetworkAddressException):
 			Address_Block.parse("0.0.0.2/30")
 		
+		with pytest.raises(InvalidPrefixException):
+			Address_Block.parse("0.0.0.0/33")
 		with pytest.raises(InvalidPrefixException):
 			Address_Block.parse("::/129")
 		with pytest.raises(InvalidPrefixException):
@@ -41,6 +60,16 @@ class Test_AddressBlock:
 		assert Address_Block.parse("0.0.0.0/24").toString() == "0.0.0.0/24"
 
 
+	def test_sort(self):
+		blocks = [Address_Block.parse(x) for x in ("0.0.1.0/24", "0.0.0.128/25", "0.0.0.0/25", "0.0.0.0/24", "0.0.0.0/23")]
+		Address_Block.sort(blocks)
+		assert blocks == [Address_Block.parse(x) for x in ("0.0.0.0/23", "0.0.0.0/24", "0.0.0.0/25", "0.0.0.128/25", "0.0.1.0/24")]
+
+		blocks = [Address_Block.parse(x) for x in ("::2", "::", "::1")]
+		Address_Block.sort(blocks)
+		assert blocks == [Address_Block.parse(x) for x in ("::", "::1", "::2")]
+
+
 	def test_merge_super(self):
 		a = Address_Block.parse("0.0.0.0/24")
 		b = Address_Block.parse("0.0.0.128/25")
@@ -62,6 +91,15 @@ class Test_AddressBlock:
 		assert Address_Block.merge(b, a) == Address_Block.parse("0.0.0.0/23")
 	
 
+	def test_merge_sorted(self):
+		blocks = [Address_Block.parse(x) for x in ("0.0.0.0/24", "0.0.0.5", "0.0.1.0/24", "0.0.1.0/24", "0.0.3.0/24", "0.0.4.0/23", "0.0.6.0/23")]
+		reported = []
+		merged = Address_Block.mergeSorted(blocks, lambda block1, block2, mergedBlock: reported.append(mergedBlock))
+		assert merged == [Address_Block.parse(x) for x in ("0.0.0.0/23", "0.0.3.0/24", "0.0.4.0/22")]
+		assert len(reported) == 4
+		assert Address_Block.mergeSorted([]) == []
+	
+
 	def test_merge_fail(self):
 		a = Address_Block.parse("0.0.0.0/24")
 		b = Address_Block.parse("0.0.2.0/24")
@@ -80,6 +80,16 @@ class Test_IPv6:
 		assert IPv6_Address.parse("0:0:0:0:0:255.255.255.255:0") == None
 	
 
+	def test_longest_zero_segment_string(self):
+		assert IPv6_Address.findLongestZeroSegmentString([1, 1, 1, 1, 1, 1, 1, 1]) == (None, 0)
+		assert IPv6_Address.findLongestZeroSegmentString([0, 0, 0, 0, 0, 0, 0, 0]) == (0, 8)
+		assert IPv6_Address.findLongestZeroSegmentString([1, 0, 0, 1, 0, 0, 0, 1]) == (4, 3)
+		assert IPv6_Address.findLongestZeroSegmentString([0, 0, 1, 0, 0, 1, 1, 1]) == (0, 2)
+		assert IPv6_Address.findLongestZeroSegmentString([1, 1, 1, 1, 1, 0, 0, 0]) == (5, 3)
+		assert IPv6_Address.findLongestZeroSegmentString([1, 1, 0, 0, 0, 0]) == (2, 4)
+		assert IPv6_Address.findLongestZeroSegmentString([]) == (None, 0)
+
+
 	def test_stringify(self):
 		class TestingParameters:
 			def __init__(
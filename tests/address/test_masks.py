@@ -9,6 +9,11 @@ class Test_Mask:
 		assert prefixToMask(32, 0) == 0
 		assert prefixToMask(32, 32) == (1 << 32) - 1
 
+		assert prefixToMask(128, 64) == ((1 << 64) - 1) << 64
+		assert prefixToMask(128, 128) == (1 << 128) - 1
+
+		assert prefixToMask(8, 4) == 0xF0
+
 		assert prefixToMask(0, 0) == 0
 
 	def test_masks_fail(self):
@@ -16,5 +21,7 @@ class Test_Mask:
 			prefixToMask(32, -1)
 		with pytest.raises(InvalidPrefixException):
 			prefixToMask(32, 33)
+		with pytest.raises(InvalidPrefixException):
+			prefixToMask(128, 129)
 		with pytest.raises(InvalidPrefixException):
 			prefixToMask(-1, 0)
@@ -51,3 +51,41 @@ FF80::/31
 		print(result)
 
 		assert result == expectedResult
+
+
+	def test_merge_aggregation(self, tmp_path: Path):
+		file = str(tmp_path) + "/file.txt"
+
+		testInput = """
+10.0.0.192/26
+10.0.0.0/26
+10.0.1.5
+10.0.0.128/26
+10.0.1.0/24
+10.0.0.64/26
+10.0.3.0/24
+10.0.3.0/24
+10.0.3.7
+10.0.4.0/23
+10.0.6.0/23
+"""
+
+		expectedResult = """10.0.0.0/23
+10.0.3.0/24
+10.0.4.0/22
+"""
+
+		with open(file, "w") as writer:
+			writer.write(testInput)
+		
+		blocks = readInput([file])
+		merge(blocks)
+
+		outFile = str(tmp_path) + "/out.txt"
+		with open(outFile, "w") as writer:
+			printOutput(writer, blocks)
+		
+		with open(outFile, "r") as reader:
+			result = "".join(reader.readlines())
+
+		assert result == expectedResult